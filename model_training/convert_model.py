@@ -0,0 +1,166 @@
+"""
+One-time conversion of backend/model/ewaste_model.h5 to TensorFlow Lite.
+
+The Flask app prefers the .tflite file when it exists: the TFLite
+interpreter (with the XNNPACK delegate built into recent TFLite) is much
+lighter than loading the full Keras model and avoids the per-request
+overhead of model.predict(). Run this after training:
+
+    cd model_training
+    python convert_model.py             # plain float32 conversion
+    python convert_model.py --float16   # half-size weights, same accuracy
+    python convert_model.py --int8      # full int8 (needs training images)
+    python convert_model.py --onnx      # ONNX for onnxruntime (needs tf2onnx)
+    python convert_model.py --openvino  # OpenVINO int8 IR (needs openvino+nncf
+                                        # and training images for calibration)
+"""
+
+import argparse
+import os
+import random
+
+import tensorflow as tf
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_DIR = os.path.join(BASE_DIR, "backend", "model")
+DATASET_DIR = os.path.join(BASE_DIR, "dataset", "modified-dataset", "train")
+
+H5_PATH = os.path.join(MODEL_DIR, "ewaste_model.h5")
+TFLITE_PATH = os.path.join(MODEL_DIR, "ewaste_model.tflite")
+TFLITE_FP16_PATH = os.path.join(MODEL_DIR, "ewaste_model_fp16.tflite")
+TFLITE_INT8_PATH = os.path.join(MODEL_DIR, "ewaste_model_int8.tflite")
+ONNX_PATH = os.path.join(MODEL_DIR, "ewaste_model.onnx")
+OPENVINO_XML_PATH = os.path.join(MODEL_DIR, "ewaste_model_int8.xml")
+
+IMG_SIZE = (224, 224)
+
+
+def representative_dataset(num_samples=200):
+    """Yield a few hundred preprocessed training images for int8 calibration."""
+    from PIL import Image
+    import numpy as np
+
+    paths = []
+    for root, _dirs, files in os.walk(DATASET_DIR):
+        for name in files:
+            if name.lower().endswith((".jpg", ".jpeg", ".png")):
+                paths.append(os.path.join(root, name))
+    if not paths:
+        raise SystemExit(
+            f"No calibration images found under {DATASET_DIR}. "
+            "Int8 quantization needs the training dataset in place."
+        )
+    random.shuffle(paths)
+    paths = paths[:num_samples]
+
+    def gen():
+        for path in paths:
+            image = Image.open(path).convert("RGB").resize(IMG_SIZE)
+            x = np.asarray(image, dtype=np.float32) / 255.0
+            yield [x[None, ...]]
+
+    return gen
+
+
+def with_argmax_head(model):
+    """Wrap the classifier so the graph itself returns (class_idx, confidence).
+
+    The app then reads two scalars per image instead of the full probability
+    vector and skips the Python-side argmax; it detects the head by the
+    2-element output shape.
+    """
+    probs = model.output  # the training script ends in a softmax layer
+    idx = tf.cast(tf.argmax(probs, axis=-1), tf.float32)
+    conf = tf.reduce_max(probs, axis=-1)
+    return tf.keras.Model(model.input, tf.stack([idx, conf], axis=-1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--float16",
+        action="store_true",
+        help="quantize weights to float16 (half the file size; TFLite "
+        "dequantizes to float32 at compute time so accuracy is unchanged)",
+    )
+    mode.add_argument(
+        "--int8",
+        action="store_true",
+        help="full int8 quantization calibrated on training images (4x "
+        "smaller; needs a TFLite runtime with x86 int8 kernels to be fast)",
+    )
+    mode.add_argument(
+        "--onnx",
+        action="store_true",
+        help="export ONNX for onnxruntime, the fastest CPU backend the app "
+        "knows about (requires the tf2onnx package)",
+    )
+    mode.add_argument(
+        "--openvino",
+        action="store_true",
+        help="export an int8 OpenVINO IR quantized with NNCF, the fastest "
+        "path on VNNI-capable x86 CPUs (needs openvino, nncf and training "
+        "images for calibration)",
+    )
+    parser.add_argument(
+        "--argmax-head",
+        action="store_true",
+        help="bake argmax into the graph so it outputs only (class index, "
+        "confidence) instead of the full probability vector",
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(H5_PATH):
+        raise SystemExit(
+            f"Model file not found at {H5_PATH}. "
+            "Train the model first by running model_training/train_model.py"
+        )
+
+    model = tf.keras.models.load_model(H5_PATH)
+    if args.argmax_head:
+        model = with_argmax_head(model)
+
+    if args.onnx:
+        import tf2onnx
+        tf2onnx.convert.from_keras(model, opset=17, output_path=ONNX_PATH)
+        print(f"Wrote {ONNX_PATH} ({os.path.getsize(ONNX_PATH) / 1e6:.1f} MB)")
+        return
+
+    if args.openvino:
+        import nncf
+        import openvino as ov
+        ov_model = ov.convert_model(model)
+        calibration = nncf.Dataset(list(representative_dataset()()),
+                                   lambda item: item[0])
+        quantized = nncf.quantize(ov_model, calibration)
+        ov.save_model(quantized, OPENVINO_XML_PATH)
+        print(f"Wrote {OPENVINO_XML_PATH} (+ .bin)")
+        return
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if args.float16:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+        out_path = TFLITE_FP16_PATH
+    elif args.int8:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset()
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        # uint8 input means the app can feed raw pixels; the /255 rescale is
+        # folded into the baked-in quantization parameters
+        converter.inference_input_type = tf.uint8
+        converter.inference_output_type = tf.float32
+        out_path = TFLITE_INT8_PATH
+    else:
+        out_path = TFLITE_PATH
+    tflite_bytes = converter.convert()
+
+    with open(out_path, "wb") as f:
+        f.write(tflite_bytes)
+
+    print(f"Wrote {out_path} ({os.path.getsize(out_path) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()